@@ -1,3 +1,4 @@
+import logging
 from typing import Any, List, Optional, Tuple, Union
 
 import pandas as pd
@@ -5,6 +6,8 @@ import polars as pl
 from sklearn.base import BaseEstimator
 from sklearn.utils.validation import check_array, check_is_fitted
 
+logger = logging.getLogger(__name__)
+
 
 def check_ready_to_transform(
     transformer: Any,
@@ -51,12 +54,8 @@ def check_ready_to_transform(
 
     if isinstance(features, list):
         if not all(c in X.columns for c in features):
-            not_in_df = (
-                str(list(dict.fromkeys([c for c in features if c not in X.columns])))
-                .replace("[", "")
-                .replace("]", "")
-                .replace("'", "`")
-            )
+            missing = [c for c in dict.fromkeys(features) if c not in X.columns]
+            not_in_df = ", ".join(f"`{c}`" for c in missing)
             raise ValueError(
                 f"""
                 {transformer.__class__.__name__}:
@@ -88,7 +87,8 @@ def check_ready_to_transform(
     for column in X_tmp.columns:
         X_tmp[column] = X_tmp[column].astype(X[column].dtype)
 
-    non_included_features = [c for c in X.columns if c not in features]
+    feature_set = set(features)
+    non_included_features = [c for c in X.columns if c not in feature_set]
     if non_included_features:
         X_tmp = pd.concat([X_tmp, X[non_included_features]], axis=1)
 
@@ -151,9 +151,10 @@ def prepare_categorical_data(
     for feature, threshold in categories:
         if (str(X[feature].dtype) != "object") or (X[feature].nunique() > threshold):
             cat_features.remove(feature)
-            print(
-                f"""{feature} has fewer unique values than {threshold}.
-                So it will not be converted to Category dtype."""
+            logger.info(
+                "%s is not of object dtype or has more than %s unique values. So it will not be converted to Category dtype.",
+                feature,
+                threshold,
             )
 
     pd.options.mode.chained_assignment = None
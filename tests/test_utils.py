@@ -1,7 +1,10 @@
+import logging
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from sk_transformers.base_transformer import BaseTransformer
 from sk_transformers.utils import (
     check_data,
     check_ready_to_transform,
@@ -49,6 +52,64 @@ def test_check_ready_to_transform_for_wrong_columns() -> None:
     )
 
 
+def test_check_ready_to_transform_for_wrong_column_with_brackets() -> None:
+    with pytest.raises(ValueError) as error:
+        check_ready_to_transform(None, pd.DataFrame({"a": [1, 2, 3]}), ["[b]", "c's"])
+
+    assert """
+                NoneType:
+                Not all provided `features` could be found in `X`! Following columns were not found in the dataframe: `[b]`, `c's`.
+                """ == str(
+        error.value
+    )
+
+
+def test_check_ready_to_transform_for_wrong_columns_keeps_order() -> None:
+    with pytest.raises(ValueError) as error:
+        check_ready_to_transform(
+            None, pd.DataFrame({"a": [1, 2, 3]}), ["c", "a", "b", "c"]
+        )
+
+    assert """
+                NoneType:
+                Not all provided `features` could be found in `X`! Following columns were not found in the dataframe: `c`, `b`.
+                """ == str(
+        error.value
+    )
+
+
+def test_check_ready_to_transform_for_wrong_tuple_column() -> None:
+    with pytest.raises(ValueError) as error:
+        check_ready_to_transform(None, pd.DataFrame({"a": [1, 2, 3]}), [("a", "b")])
+
+    assert """
+                NoneType:
+                Not all provided `features` could be found in `X`! Following columns were not found in the dataframe: `('a', 'b')`.
+                """ == str(
+        error.value
+    )
+
+
+def test_check_ready_to_transform_for_wrong_non_string_column() -> None:
+    with pytest.raises(ValueError) as error:
+        check_ready_to_transform(None, pd.DataFrame({"a": [1, 2, 3]}), [1])
+
+    assert """
+                NoneType:
+                Not all provided `features` could be found in `X`! Following columns were not found in the dataframe: `1`.
+                """ == str(
+        error.value
+    )
+
+
+def test_check_ready_to_transform_keeps_non_included_features() -> None:
+    X = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]})
+    result = check_ready_to_transform(BaseTransformer().fit(), X, ["b"])
+
+    assert result.columns.to_list() == ["b", "a", "c"]
+    assert result[X.columns].equals(X)
+
+
 def test_check_ready_to_transform_for_wrong_subclass_of_transformer() -> None:
     with pytest.raises(TypeError) as error:
         check_ready_to_transform(None, pd.DataFrame({"a": [1, 2, 3]}), ["a"])
@@ -117,3 +178,17 @@ def test_prepare_categorical_data(X_categorical) -> None:
         index=X_categorical.columns,
     )
     assert result.equals(expected)
+
+
+def test_prepare_categorical_data_logs_skipped_features(X_categorical, caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="sk_transformers.utils"):
+        prepare_categorical_data(X_categorical, [("a", 1), ("b", 10)])
+
+    assert (
+        "a is not of object dtype or has more than 1 unique values. So it will not be converted to Category dtype."
+        in caplog.text
+    )
+    assert (
+        "b is not of object dtype or has more than 10 unique values. So it will not be converted to Category dtype."
+        in caplog.text
+    )